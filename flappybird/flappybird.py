@@ -12,12 +12,17 @@ from pygame.locals import *
 
 
 FPS = 60
+MSEC_PER_FRAME = 1000.0 / FPS
 ANIMATION_SPEED = 0.18  # pixels per millisecond
+ANIMATION_SPEED_PER_FRAME = ANIMATION_SPEED * MSEC_PER_FRAME  # pixels per frame
 WINDOW_WIDTH = 284 * 2     #image size for the games terminal window: 284x512
 WINDOW_HEIGHT = 512
+BACKGROUND_POSITIONS = [(0, 0), (WINDOW_WIDTH // 2, 0)]  # background is tiled twice
 
+_CACTUS_CACHE = {}  # (tip image, body image, top pieces, bottom pieces) -> (image, hitboxes)
 
-class Lizard(pygame.sprite.Sprite):
+
+class Lizard:
     """ This class represents the player-controlled lizard in the game.
 The lizard serves as the player and responds to player input. 
 It can ascend when prompted (space bar up arrow), or descend due to gravity when not climbing. 
@@ -29,6 +34,8 @@ Attributes:
 - y: The Y coordinate of the lizard.
 - MAX_REMAINING_FLY_TIME: The remaining milliseconds for the lizard to complete its climb. 
 A full climb takes lizard.FLY_TIME milliseconds.
+- image: The lizard's image for the current frame, chosen by set_facing.
+- hitbox: Rect around the visible pixels of either image, used for collisions.
 
 Constants:
 - WIDTH: The width, in pixels, of the lizard's image.
@@ -36,12 +43,17 @@ Constants:
 - GRAVITY_SPEED: The speed, in pixels per millisecond, at which the lizard descends when not climbing.
 - FLYING_SPEED: The speed, in pixels per millisecond, at which the lizard ascends while climbing, on average. Refer to the lizard.update docstring for more details.
 - FLY_TIME: The number of milliseconds required for the lizard to execute a complete fly.
+- FACING_TIME: The number of milliseconds the lizard faces one way before flipping to the other.
 """
 
+    __slots__ = ('x', 'y', 'MAX_REMAINING_FLY_TIME', 'image',
+                 '_img_FacingUp', '_img_FacingDown', '_hitbox', '_rect')
+
     WIDTH = HEIGHT = 32
     GRAVITY_SPEED = 0.12
     FLYING_SPEED = 0.4
     FLY_TIME = 111.3
+    FACING_TIME = 250
 
     def __init__(self, x, y, MAX_REMAINING_FLY_TIME, images):
         """ Parameters:
@@ -52,12 +64,16 @@ Constants:
           
         """
 
-        super(Lizard, self).__init__()
         self.x, self.y = x, y
         self.MAX_REMAINING_FLY_TIME = MAX_REMAINING_FLY_TIME
         self._img_FacingUp, self._img_FacingDown = images
-        self._mask_FacingUp = pygame.mask.from_surface(self._img_FacingUp)
-        self._mask_FacingDown = pygame.mask.from_surface(self._img_FacingDown)
+        # bounding box of the pixels in either image with transparency
+        # levels not exceeding 127, relative to the lizard's position
+        bounds = (pygame.mask.from_surface(self._img_FacingUp).get_bounding_rects() +
+                  pygame.mask.from_surface(self._img_FacingDown).get_bounding_rects())
+        self._hitbox = bounds[0].unionall(bounds[1:])
+        self._rect = Rect(x, y, Lizard.WIDTH, Lizard.HEIGHT)
+        self.set_facing(False)
 
     def update(self, Frame_Counter=1):
         """This function employs the function to ensure a gradual ascent:
@@ -73,44 +89,46 @@ Constants:
          of this method starts @ 1.
         """
 
+        elapsed_msec = MSEC_PER_FRAME * Frame_Counter
         if self.MAX_REMAINING_FLY_TIME > 0:
-            Lizzard_Climb_Finished = 1 - self.MAX_REMAINING_FLY_TIME/Lizard.FLY_TIME
-            self.y -= (Lizard.FLYING_SPEED * frames_to_msec(Frame_Counter) *
-                       (1 - math.cos(Lizzard_Climb_Finished * math.pi)))
-            self.MAX_REMAINING_FLY_TIME -= frames_to_msec(Frame_Counter)
+            self.y -= climb_distance(self.MAX_REMAINING_FLY_TIME, Lizard.FLY_TIME,
+                                     Lizard.FLYING_SPEED, elapsed_msec)
+            self.MAX_REMAINING_FLY_TIME -= elapsed_msec
         else:
-            self.y += Lizard.GRAVITY_SPEED * frames_to_msec(Frame_Counter)
+            self.y += Lizard.GRAVITY_SPEED * elapsed_msec
 
-    @property
-    def image(self):
-        """
+    def set_facing(self, facing_up):
+        """Select the image for the current frame.
+
+        Call this every FACING_TIME milliseconds, flipping facing_up each time.
+        Alternating between the two images animates the lizard going up &
+        Down, since pygame doesn't support animated GIFs.
 
-        This will decide whether to return an image where the lizard
-         is pointing upward or where it is pointing downward
-        based on pygame.time.get_ticks().  This will animate the
-        lizard going up & Down, Since pygame doesn't support animated GIFs.
+        Arguments:
+        facing_up: Whether the lizard should point upward.
         """
-        if pygame.time.get_ticks() % 500 >= 250:
-            return self._img_FacingUp
+        if facing_up:
+            self.image = self._img_FacingUp
         else:
-            return self._img_FacingDown
+            self.image = self._img_FacingDown
 
     @property
-    def mask(self):
-        """Generate a collision detection bitMask by excluding pixels in self.image 
-        with any transparency levels exceeding 127"""
-        if pygame.time.get_ticks() % 500 >= 250:
-            return self._mask_FacingUp
-        else:
-            return self._mask_FacingDown
+    def rect(self):
+        """Retrieve the lizard's coordinates, width, and height information in the form of a pygame.Rect.
+
+        The same Rect is reused and moved on every access, so don't keep it
+        around across frames.
+        """
+        self._rect.topleft = (self.x, self.y)
+        return self._rect
 
     @property
-    def rect(self):
-        """Retrieve the lizard's coordinates, width, and height information in the form of a pygame.Rect."""
-        return Rect(self.x, self.y, Lizard.WIDTH, Lizard.HEIGHT)
+    def hitbox(self):
+        """Get the Rect around the lizard's visible pixels, in screen coordinates."""
+        return self._hitbox.move(self.rect.topleft)
 
 
-class Cactus_Pair(pygame.sprite.Sprite):
+class Cactus_Pair:
     """Defines a Cactus Pair object representing obstacles in the game.
 
     A Cactus Pair consists of a top and bottom cactus, creating a passage
@@ -121,9 +139,10 @@ class Cactus_Pair(pygame.sprite.Sprite):
     x: Float representing the X position of the Cactus Pair for smooth
         movement. There is no y attribute, as it is always set to 0.
     image: Pygame.Surface that can have the pixels rendered to the display surface to
-        visually represent the Cactus Pair.
-    Mask: BitMask excluding pixels in self.image with transparency
-        greater than 127, useful for collision detection.
+        visually represent the Cactus Pair.  Shared between Cactus Pairs with
+        the same piece counts, so it must not be drawn on.
+    hitboxes: Rects around the top and bottom cactus, relative to the
+        Cactus Pair's position, useful for collision detection.
     Top_Cactus_Pair_Pieces: Number of pieces, including the end piece, in the top cactus.
     Bottom_Cactus_Pair_Pieces: Number of pieces, including the end piece, in the
         bottom cactus.
@@ -134,6 +153,9 @@ class Cactus_Pair(pygame.sprite.Sprite):
     ADD_INTERVAL: time in milliseconds between adding new cactus peices.
     """
 
+    __slots__ = ('x', 'Recorded_Score', 'image', 'hitboxes',
+                 'Top_Cactus_Pair_Pieces', 'Bottom_Cactus_Pair_Pieces', '_rect')
+
     WIDTH = 80
     PIECE_HEIGHT = 32
     ADD_INTERVAL = 3000
@@ -151,10 +173,8 @@ class Cactus_Pair(pygame.sprite.Sprite):
         """
         self.x = float(WINDOW_WIDTH - 1)
         self.Recorded_Score = False
+        self._rect = Rect(self.x, 0, Cactus_Pair.WIDTH, Cactus_Pair.PIECE_HEIGHT)
 
-        self.image = pygame.Surface((Cactus_Pair.WIDTH, WINDOW_HEIGHT), SRCALPHA)
-        self.image.convert()   # speeds up blitting
-        self.image.fill((0, 0, 0, 0))
         total_Cactus_body_pieces = int(
             (WINDOW_HEIGHT -                  # fill window from top to bottom
              3 * Lizard.HEIGHT -             # make room for lizard to fit through
@@ -164,26 +184,59 @@ class Cactus_Pair(pygame.sprite.Sprite):
         self.Bottom_Cactus_Pair_Pieces = randint(1, total_Cactus_body_pieces)
         self.Top_Cactus_Pair_Pieces = total_Cactus_body_pieces - self.Bottom_Cactus_Pair_Pieces
 
+        # only a handful of piece combinations exist, so each image and its
+        # hitboxes are rendered once and then shared between Cactus_Pairs
+        key = (Cactus_Tip_img, Cactus_body_img,
+               self.Top_Cactus_Pair_Pieces, self.Bottom_Cactus_Pair_Pieces)
+        if key not in _CACTUS_CACHE:
+            _CACTUS_CACHE[key] = Cactus_Pair._render(*key)
+        self.image, self.hitboxes = _CACTUS_CACHE[key]
+
+        # compensate for added end cactus tip
+        self.Top_Cactus_Pair_Pieces += 1
+        self.Bottom_Cactus_Pair_Pieces += 1
+
+    @staticmethod
+    def _render(Cactus_Tip_img, Cactus_body_img, top_pieces, bottom_pieces):
+        """Draw a Cactus_Pair image and find its collision hitboxes.
+
+        Returns an (image, hitboxes) tuple.  The cactus pieces are opaque
+        rectangles, so the bounding Rects of the visible pixels cover the top
+        and bottom cactus exactly.
+
+        Arguments:
+        Cactus_Tip_img: The image to use to represent a cactus end piece.
+        Cactus_body_img: The image to use to represent one horizontal slice
+            of a cactus body.
+        top_pieces: Number of body pieces in the top cactus, not counting
+            its end piece.
+        bottom_pieces: Number of body pieces in the bottom cactus, not
+            counting its end piece.
+        """
+        image = pygame.Surface((Cactus_Pair.WIDTH, WINDOW_HEIGHT),
+                               SRCALPHA).convert_alpha()   # speeds up blitting
+        image.fill((0, 0, 0, 0))
+
         # bottom cactus
-        for i in range(1, self.Bottom_Cactus_Pair_Pieces + 1):
-            piece_pos = (0, WINDOW_HEIGHT - i*Cactus_Pair.PIECE_HEIGHT)
-            self.image.blit(Cactus_body_img, piece_pos)
-        bottom_Cactus_Tip_y = WINDOW_HEIGHT - self.bottom_height_px
+        bottom_piece_pos = [(0, WINDOW_HEIGHT - i*Cactus_Pair.PIECE_HEIGHT)
+                            for i in range(1, bottom_pieces + 1)]
+        bottom_Cactus_Tip_y = WINDOW_HEIGHT - bottom_pieces * Cactus_Pair.PIECE_HEIGHT
         bottom_end_piece_pos = (0, bottom_Cactus_Tip_y - Cactus_Pair.PIECE_HEIGHT)
-        self.image.blit(Cactus_Tip_img, bottom_end_piece_pos)
 
         # top cactus
-        for i in range(self.Top_Cactus_Pair_Pieces):
-            self.image.blit(Cactus_body_img, (0, i * Cactus_Pair.PIECE_HEIGHT))
-        top_Cactus_Tip_y = self.top_height_px
-        self.image.blit(Cactus_Tip_img, (0, top_Cactus_Tip_y))
+        top_piece_pos = [(0, i * Cactus_Pair.PIECE_HEIGHT)
+                         for i in range(top_pieces)]
+        top_Cactus_Tip_y = top_pieces * Cactus_Pair.PIECE_HEIGHT
 
-        # compensate for added end cactus tip
-        self.Top_Cactus_Pair_Pieces += 1
-        self.Bottom_Cactus_Pair_Pieces += 1
+        # all pieces are drawn with a single call, in the same order as above
+        pieces = [(Cactus_body_img, pos) for pos in bottom_piece_pos]
+        pieces.append((Cactus_Tip_img, bottom_end_piece_pos))
+        pieces.extend((Cactus_body_img, pos) for pos in top_piece_pos)
+        pieces.append((Cactus_Tip_img, (0, top_Cactus_Tip_y)))
+        blit_sequence(image, pieces)
 
         # for detection of collision of lizard
-        self.mask = pygame.mask.from_surface(self.image)
+        return image, pygame.mask.from_surface(image).get_bounding_rects()
 
     @property
     def top_height_px(self):
@@ -202,8 +255,13 @@ class Cactus_Pair(pygame.sprite.Sprite):
 
     @property
     def rect(self):
-        """Get the Rect which contains this Cactus_Pair."""
-        return Rect(self.x, 0, Cactus_Pair.WIDTH, Cactus_Pair.PIECE_HEIGHT)
+        """Get the Rect which contains this Cactus_Pair.
+
+        The same Rect is reused and moved on every access, so don't keep it
+        around across frames.
+        """
+        self._rect.x = self.x
+        return self._rect
 
     def update(self, Frame_Counter=1):
         """Update the Cactus_Pair's position.
@@ -212,16 +270,22 @@ class Cactus_Pair(pygame.sprite.Sprite):
         Frame_Counter: The number of frames elapsed since this method was
             last called.
         """
-        self.x -= ANIMATION_SPEED * frames_to_msec(Frame_Counter)
+        self.x -= ANIMATION_SPEED_PER_FRAME * Frame_Counter
 
-    def collides_with(self, lizard):
+    def collides_with(self, lizard_hitbox):
         """Get whether the lizard collides with a cactus in this Cactus_Pair.
 
         Arguments:
-        lizard: The lizard which should be tested for collision with this
-            Cactus_Pair.
+        lizard_hitbox: The lizard's hitbox, in screen coordinates, which
+            should be tested for collision with this Cactus_Pair.  Get it
+            once per frame from Lizard.hitbox.
         """
-        return pygame.sprite.collide_mask(self, lizard)
+        pair_x = self.rect.x
+        # skip pairs the lizard can't reach before making a shifted Rect
+        if not pair_x - lizard_hitbox.width < lizard_hitbox.x < pair_x + Cactus_Pair.WIDTH:
+            return False
+        hitbox = lizard_hitbox.move(-pair_x, 0)
+        return hitbox.collidelist(self.hitboxes) != -1
 
 
 def load_images():
@@ -239,25 +303,26 @@ def load_images():
         cactus-body to make Cactus.
     """
 
-    def load_image(img_file_name):
+    def load_image(img_file_name, alpha=True):
         """Return the loaded pygame image with the specified file name.
 
         This function looks for images in the game's images folder
-        (dirname(__file__)/images/). All images are converted before being
-        returned to speed up blitting.
+        (dirname(__file__)/images/). All images are converted to the display's
+        pixel format before being returned to speed up blitting.
 
         Arguments:
         img_file_name: The file name (including its extension, e.g.
             '.png') of the required image, without a file path.
+        alpha: Whether the image has transparent pixels.  Opaque images
+            are converted without an alpha channel.  Default: True.
         """
     
         file_name = os.path.join(os.path.dirname(__file__),
                                  'images', img_file_name)
         img = pygame.image.load(file_name)
-        img.convert()
-        return img
+        return img.convert_alpha() if alpha else img.convert()
 
-    return {'background': load_image('background.png'),
+    return {'background': load_image('background.png', alpha=False),
             'Cactus-Tip': load_image('Cactus_Tip.png'),
             'Cactus-body': load_image('Cactus_body.png'),
             'lizard-FacingUp': load_image('lizard_Facing_Up.png'),
@@ -284,153 +349,281 @@ def msec_to_frames(milliseconds, fps=FPS):
     """
     return fps * milliseconds / 1000.0
 
-pygame.init()
 
-font = pygame.font.SysFont("arialblack", 20)
-TEXT_COL = (255, 255, 255)
+def climb_distance(remaining_fly_time, fly_time, flying_speed, elapsed_msec):
+    """Get how many pixels the lizard climbs in elapsed_msec milliseconds.
 
-display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption('Flappy Lizard')
+    This only does arithmetic on its arguments, so it stays cheap to call
+    and can be compiled as-is by a JIT (e.g. PyPy's).
 
-clock = pygame.time.Clock()
-score_font = pygame.font.SysFont(None, 32, bold=True)  # default font
-images = load_images()
+    Arguments:
+    remaining_fly_time: Milliseconds left in the current climb.
+    fly_time: Milliseconds a complete climb takes.
+    flying_speed: Average climbing speed, in pixels per millisecond.
+    elapsed_msec: Milliseconds elapsed since the last update.
+    """
+    Lizzard_Climb_Finished = 1 - remaining_fly_time/fly_time
+    return (flying_speed * elapsed_msec *
+            (1 - math.cos(Lizzard_Climb_Finished * math.pi)))
 
-def draw_text(text, font, text_col, x, y):
+
+ADD_INTERVAL_FRAMES = int(msec_to_frames(Cactus_Pair.ADD_INTERVAL))
+
+# the only event types each loop handles, see get_events
+GAME_EVENTS = [QUIT, KEYUP, MOUSEBUTTONUP, WINDOWEXPOSED]
+MENU_EVENTS = [QUIT, KEYDOWN]
+KEYUP_ACTIONS = {K_ESCAPE: 'quit',
+                 K_PAUSE: 'pause', K_p: 'pause',
+                 K_UP: 'fly', K_RETURN: 'fly', K_SPACE: 'fly'}
+
+TEXT_COL = (255, 255, 255)
+
+def draw_text(surface, text, font, text_col, x, y):
     img = font.render(text, True, text_col)
-    display_surface.blit(img,(x, y))
+    surface.blit(img,(x, y))
+
+
+def get_events(eventtypes):
+    """Return the queued events of the given types and drop all others.
+
+    Unhandled events (mouse motion in particular) are discarded in C
+    instead of being looped over in Python.
+
+    Arguments:
+    eventtypes: A list of the event types to return.
+    """
+    events = pygame.event.get(eventtypes)
+    pygame.event.clear(pump=False)
+    return events
+
+
+def wait_events(eventtypes):
+    """Sleep until an event arrives, then return like get_events.
+
+    Used by the menus, which only change on input, so they don't poll
+    the event queue in a busy loop.
+
+    Arguments:
+    eventtypes: A list of the event types to return.
+    """
+    event = pygame.event.wait()
+    events = [event] if event.type in eventtypes else []
+    return events + get_events(eventtypes)
+
+
+def blit_sequence(surface, sequence):
+    """Draw every (source, dest) pair in sequence onto surface in one call.
+
+    pygame-ce's Surface.fblits is used when available, falling back to
+    Surface.blits on vanilla pygame.
+
+    Arguments:
+    surface: The pygame.Surface to draw onto.
+    sequence: A list of (source Surface, destination) tuples, drawn in order.
+    """
+    if hasattr(surface, 'fblits'):
+        surface.fblits(sequence)
+    else:
+        surface.blits(sequence, doreturn=0)
     
     
 """
 This is the start menu loop where the player starts out
 it shows a little start prompt and message for the player
-to get started
+to get started.
+It returns 'play' to start the game or 'quit' if the window was closed
 """
 
-def startMenuLoop():
-    run = True
-    while run:
+def startMenuLoop(display_surface, font):
+    while True:
         display_surface.fill((52, 78, 91))
-        draw_text("FLAPPY LIZARD", font, TEXT_COL, 50, 100)
-        draw_text("Press SPACE to Jump and Start!!", font, TEXT_COL, 50, 150)
-        draw_text("Created by the Tiger Team", font, TEXT_COL, 50, 400)
+        draw_text(display_surface, "FLAPPY LIZARD", font, TEXT_COL, 50, 100)
+        draw_text(display_surface, "Press SPACE to Jump and Start!!", font, TEXT_COL, 50, 150)
+        draw_text(display_surface, "Created by the Tiger Team", font, TEXT_COL, 50, 400)
         #Detects button press that finishes this function and since
         #it is run in main, it goes right into the main game loop
         #and runs the game
+        pygame.display.update()
         
-        for event in pygame.event.get():
+        for event in wait_events(MENU_EVENTS):
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    run = False
-        if event.type == pygame.QUIT:
-            run = False
-            pygame.display.quit()
-        pygame.display.update()
-
-def gameLoop():
-    """The application's entry point.
+                    return 'play'
+            if event.type == pygame.QUIT:
+                return 'quit'
 
-    If someone executes this module (instead of importing it, for
-    example), this function is called.
-    """
-    
+def gameLoop(display_surface, images, score_font):
     """
     Updated gameplay loop to be within this function as opposed to main
+    Returns a (score, quit_requested) tuple once the game is over, where
+    quit_requested is True if the player closed the window.
+
+    Arguments:
+    display_surface: The window's display surface to draw on.
+    images: The dictionary of images returned by load_images().
+    score_font: The font used to draw the score.
     """
     
+    clock = pygame.time.Clock()
+
     # the lizard stays in the same x position, so lizard.x is a constant
     # center lizard on screen
     lizard = Lizard(50, int(WINDOW_HEIGHT/2 - Lizard.HEIGHT/2), 2,
                 (images['lizard-FacingUp'], images['lizard-FacingDown']))
 
     Cactus = deque()
+    background_blits = [(images['background'], pos) for pos in BACKGROUND_POSITIONS]
 
     Counter_For_Frames = 0  # this counter is only incremented if the game isn't paused
     score = 0
-    done = paused = False
+    rendered_score = None  # score shown by score_surface
+    # bind names used every frame to locals to skip global/attribute lookups
+    tick = clock.tick
+    blit = display_surface.blit
+    update_display = pygame.display.update
+    cactus_width = Cactus_Pair.WIDTH
+    facing_time = Lizard.FACING_TIME
+    max_lizard_y = WINDOW_HEIGHT - Lizard.HEIGHT
+    score_y = Cactus_Pair.PIECE_HEIGHT
+
+    last_drawn_rects = None  # None until the whole window has been shown once
+    facing_up = False
+    facing_msec = 0  # milliseconds since the lizard last flipped
+    done = paused = quit_requested = False
     while not done:
-        clock.tick(FPS)
+        facing_msec += tick(FPS)
+        if facing_msec >= facing_time:
+            facing_msec %= facing_time
+            facing_up = not facing_up
+            lizard.set_facing(facing_up)
         
         # Did this manualy because.  If we used pygame.time.set_timer(),
         # The cactuses being added would be messed up if a player pauses game(using p).
-        if not (paused or Counter_For_Frames % msec_to_frames(Cactus_Pair.ADD_INTERVAL)):
+        if not (paused or Counter_For_Frames % ADD_INTERVAL_FRAMES):
             pp = Cactus_Pair(images['Cactus-Tip'], images['Cactus-body'])
             Cactus.append(pp)
 
-        for e in pygame.event.get():
-            if e.type == QUIT or (e.type == KEYUP and e.key == K_ESCAPE):
+        for e in get_events(GAME_EVENTS):
+            if e.type == WINDOWEXPOSED:
+                # the window was uncovered, so show all of it next frame
+                last_drawn_rects = None
+                continue
+            if e.type == QUIT:
+                action = 'quit'
+                quit_requested = True
+            elif e.type == MOUSEBUTTONUP:
+                action = 'fly'
+            else:
+                action = KEYUP_ACTIONS.get(e.key)
+            if action == 'quit':
                 done = True
                 break
-            elif e.type == KEYUP and e.key in (K_PAUSE, K_p):
+            elif action == 'pause':
                 paused = not paused
-            elif e.type == MOUSEBUTTONUP or (e.type == KEYUP and
-                    e.key in (K_UP, K_RETURN, K_SPACE)):
+            elif action == 'fly':
                 lizard.MAX_REMAINING_FLY_TIME = Lizard.FLY_TIME
 
         if paused:
             continue  
 
-        # checks for collisions
-        Cactus_Collision = any(p.collides_with(lizard) for p in Cactus)
-        if Cactus_Collision or 0 >= lizard.y or lizard.y >= WINDOW_HEIGHT - Lizard.HEIGHT:
-            done = True
-
-        for x in (0, WINDOW_WIDTH / 2):
-            display_surface.blit(images['background'], (x, 0))
-
         while Cactus and not Cactus[0].visible:
             Cactus.popleft()
 
+        # check collisions, move, score and queue drawing in a single pass
+        Cactus_Collision = False
+        lizard_hitbox = lizard.hitbox  # the lizard doesn't move until after this pass
+        blit_seq = background_blits[:]
+        drawn_rects = []
         for p in Cactus:
+            if not Cactus_Collision and p.collides_with(lizard_hitbox):
+                Cactus_Collision = True
             p.update()
-            display_surface.blit(p.image, p.rect)
-
-        lizard.update()
-        display_surface.blit(lizard.image, lizard.rect)
-
-        # update and display score
-        for p in Cactus:
-            if p.x + Cactus_Pair.WIDTH < lizard.x and not p.Recorded_Score:
+            if not p.Recorded_Score and p.x + cactus_width < lizard.x:
                 score += 1
                 p.Recorded_Score = True
+            blit_seq.append((p.image, p.rect))
+            drawn_rects.append(p.image.get_rect(topleft=p.rect.topleft))
+        if Cactus_Collision or 0 >= lizard.y or lizard.y >= max_lizard_y:
+            done = True
 
-        score_surface = score_font.render(str(score), True, (255, 255, 255))
-        score_x = WINDOW_WIDTH/2 - score_surface.get_width()/2
-        display_surface.blit(score_surface, (score_x, Cactus_Pair.PIECE_HEIGHT))
-
-        pygame.display.flip()
+        # background, cactus and lizard are all drawn with a single call
+        lizard.update()
+        blit_seq.append((lizard.image, lizard.rect))
+        drawn_rects.append(lizard.image.get_rect(topleft=lizard.rect.topleft))
+        blit_sequence(display_surface, blit_seq)
+
+        # only re-render the score when it changes
+        if score != rendered_score:
+            score_surface = score_font.render(str(score), True, (255, 255, 255))
+            score_x = WINDOW_WIDTH/2 - score_surface.get_width()/2
+            rendered_score = score
+        drawn_rects.append(blit(score_surface, (score_x, score_y)))
+
+        # the background doesn't scroll, so only the areas sprites were drawn
+        # on this frame or the last one have changed on screen
+        if last_drawn_rects is None:
+            pygame.display.flip()
+        else:
+            update_display(last_drawn_rects + drawn_rects)
+        last_drawn_rects = drawn_rects
         Counter_For_Frames += 1
         
-    #Runs the end menu loop with the score variable so that it can be displayed to the user
-    endMenuLoop(score)
-    print('You Lost, Game over! Your Score Was: %i' % score)
-    print('   Thanks For Playing! :) -From Tiger Team (Johnathan S, Dylan, John M, Mincie)')
+    return score, quit_requested
     
 """
 This is the end menu loop that is run at the end of the main gameplay loop.
 This function prompts the user if they want to play again or if they
 want to quit the game.
-It also displays the user's score from their previous play
+It also displays the user's score from their previous play.
+It returns 'replay' to play again or 'quit' to quit the game
 """
-def endMenuLoop(score):
-    run = True
-    while run:
+def endMenuLoop(display_surface, font, score):
+    while True:
         display_surface.fill((52, 78, 91))
-        draw_text("GAME OVER! Your Score Was: %i" %score, font, TEXT_COL, 50, 200)
-        draw_text("Press Space to Play again", font, TEXT_COL, 50, 300)
-        draw_text("Press ESC to Quit", font, TEXT_COL, 50, 400)
-        for event in pygame.event.get():
+        draw_text(display_surface, "GAME OVER! Your Score Was: %i" %score, font, TEXT_COL, 50, 200)
+        draw_text(display_surface, "Press Space to Play again", font, TEXT_COL, 50, 300)
+        draw_text(display_surface, "Press ESC to Quit", font, TEXT_COL, 50, 400)
+        pygame.display.update()
+        for event in wait_events(MENU_EVENTS):
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    gameLoop()
+                    return 'replay'
                 if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    pygame.display.quit()
-        pygame.display.update()
+                    return 'quit'
+            if event.type == pygame.QUIT:
+                return 'quit'
 
 def main():
-    startMenuLoop()
-    gameLoop()
+    """The application's entry point.
+
+    If someone executes this module (instead of importing it, for
+    example), this function is called.  All setup happens here rather than
+    at module level, so the hot loops always run inside functions, which
+    also lets them be traced well when running under PyPy.
+    """
+    pygame.init()
+    pygame.event.set_blocked([MOUSEMOTION, ACTIVEEVENT, VIDEORESIZE])
+
+    display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption('Flappy Lizard')
+    images = load_images()
+    font = pygame.font.SysFont("arialblack", 20)
+    score_font = pygame.font.SysFont(None, 32, bold=True)  # default font
+
+    # each round returns here, so replaying doesn't grow the call stack
+    if startMenuLoop(display_surface, font) == 'play':
+        while True:
+            score, quit_requested = gameLoop(display_surface, images, score_font)
+            if quit_requested:
+                break
+            #Runs the end menu loop with the score variable so that it can be displayed to the user
+            if endMenuLoop(display_surface, font, score) == 'quit':
+                break
+        if not quit_requested:
+            print('You Lost, Game over! Your Score Was: %i' % score)
+        print('   Thanks For Playing! :) -From Tiger Team (Johnathan S, Dylan, John M, Mincie)')
     pygame.quit()
 
-main()
\ No newline at end of file
+
+if __name__ == '__main__':
+    main()